@@ -2,16 +2,23 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import pandas as pd
 import geopandas as gpd
-from shapely.geometry import Polygon, Point, box
+import shapely
+from pyproj import Transformer
+from shapely.geometry import Polygon, box
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
+from matplotlib.collections import PolyCollection
 import numpy as np
 import os
 from typing import Dict, List, Tuple, Optional
 import re
 import sys
 import matplotlib as mpl
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Import SVG backend explicitly to ensure it's available
 try:
@@ -19,10 +26,24 @@ try:
 except ImportError:
     print("Warning: SVG backend not available")
 
+# Keep text as editable elements in SVG exports (only the SVG backend reads this). Set once
+# here because rcParams are global and exports are saved on a worker thread
+mpl.rcParams['svg.fonttype'] = 'none'
+
 # Montana County Map Generato
 # This application generates county-based maps for Montana using lat/long data
 # with year-based filtering to create two comparison maps
 
+# Degrees/minutes/seconds pattern, e.g. 44°41.576' or 45 16 30"
+_DMS_RE = re.compile(r"^(\d+)[°\s]+(\d+(?:\.\d+)?)[\'′]?\s*(\d*(?:\.\d+)?)[\"″]?")
+
+# Normalize typographic quotes to plain ASCII minute/second symbols
+_DMS_TRANS = str.maketrans({"’": "'", "″": '"', "“": '"', "”": '"'})
+
+# US county boundaries and the projected Montana subset cached from them
+COUNTIES_SHAPEFILE = "shapefiles/cb_2021_us_county_5m.shp"
+COUNTIES_CACHE = "shapefiles/montana_counties_32100.parquet"
+
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
     import sys, os
@@ -30,6 +51,14 @@ def resource_path(relative_path):
         return os.path.join(sys._MEIPASS, relative_path)
     return os.path.join(os.path.abspath("."), relative_path)
 
+def user_cache_path(filename):
+    """Get a path in a persistent, user-writable cache directory (for PyInstaller builds)"""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, "MontanaSpecimensMapper", filename)
+
 def get_icon_path():
     """Get the path to the application icon"""
     try:
@@ -58,6 +87,19 @@ def get_icon_path():
         print(f"Warning: Error getting icon path: {str(e)}")
         return None
 
+def bind_mousewheel(canvas, handler):
+    """Route <MouseWheel> to handler only while the pointer is over canvas"""
+    def on_enter(event):
+        canvas.bind_all("<MouseWheel>", handler)
+    
+    def on_leave(event):
+        # Moving onto a child widget also fires <Leave>, so only unbind once the pointer is outside the canvas
+        if not (0 <= event.x < canvas.winfo_width() and 0 <= event.y < canvas.winfo_height()):
+            canvas.unbind_all("<MouseWheel>")
+    
+    canvas.bind("<Enter>", on_enter, add="+")
+    canvas.bind("<Leave>", on_leave, add="+")
+
 class SplashScreen:
     def __init__(self, parent):
         self.parent = parent
@@ -103,13 +145,13 @@ class SplashScreen:
         )
         self.progress.pack(pady=20)
         
-        self.splash.update()
+        self.splash.update_idletasks()
 
     def update_status(self, message: str, progress: int = None):
         self.status_label.config(text=message)
         if progress is not None:
             self.progress['value'] = progress
-        self.splash.update()
+        self.splash.update_idletasks()
 
     def destroy(self):
         self.splash.destroy()
@@ -202,12 +244,12 @@ class LoadingIndicator:
         self.loading_window.lift()
         self.loading_window.attributes('-topmost', True)
         
-        # Update the window
-        self.loading_window.update()
+        # Redraw the window without re-entering the event loop
+        self.loading_window.update_idletasks()
 
     def update_message(self, message):
         self.status_label.config(text=message)
-        self.loading_window.update()
+        self.loading_window.update_idletasks()
     
     def destroy(self):
         self.progress.stop()
@@ -277,7 +319,7 @@ class SummaryDialog:
             if self.canvas.winfo_exists():
                 self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
         
-        self.mousewheel_binding = self.canvas.bind_all("<MouseWheel>", on_mousewheel)
+        bind_mousewheel(self.canvas, on_mousewheel)
         
         # Bind window close event
         self.window.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -317,13 +359,15 @@ class SummaryDialog:
         stats_frame = tk.Frame(file_frame, bg='#ffffff')
         stats_frame.pack(fill='x')
         
+        # Taxonomy columns are Categoricals, so unique counts come from their categories
+        year_min, year_max = data['year'].agg(['min', 'max'])
         stats = [
             ("File Name:", os.path.basename(file_path)),
-            ("Total Records:", f"{len(data):,}"),
-            ("Year Range:", f"{int(data['year'].min())} - {int(data['year'].max())}"),
-            ("Unique Families:", f"{len(data['family'].unique()):,}"),
-            ("Unique Genera:", f"{len(data['genus'].unique()):,}"),
-            ("Unique Species:", f"{len(data['species'].unique()):,}")
+            ("Total Records:", f"{len(data.index):,}"),
+            ("Year Range:", f"{int(year_min)} - {int(year_max)}"),
+            ("Unique Families:", f"{data['family'].cat.categories.size:,}"),
+            ("Unique Genera:", f"{data['genus'].cat.categories.size:,}"),
+            ("Unique Species:", f"{data['species'].cat.categories.size:,}")
         ]
         
         for i, (label, value) in enumerate(stats):
@@ -445,7 +489,16 @@ class MainApplication:
         # Initialize variables
         self.excel_data = None
         self.montana_counties = None
+        self._county_verts = None  # Exterior ring vertices per county, for PolyCollection
+        self._to_county_crs = None  # Lon/lat -> county CRS transformer
+        self._montana_bounds = None  # Padded lon/lat envelope of the counties
         self.current_maps = None  # Will store both Map A and Map B
+        self._taxonomy = {}  # family -> genus -> sorted species, built on load
+        self._family_display = {}  # lowercase family -> title-cased display name
+        self._taxon_present = {}  # taxonomy column -> mask of rows with a non-empty value
+        self._load_queue = None  # Progress/results from the Excel load worker, None when idle
+        self._resize_after = None  # Pending debounced resize callback
+        self._map_artists = None  # On-screen map artists, reused across redraws
         
         # Add variables for species selection
         self.selected_family = tk.StringVar()
@@ -455,6 +508,9 @@ class MainApplication:
         # Add export format variable
         self.export_format_var = tk.StringVar(value='tiff')  # Default to tiff
         
+        # Exports are rendered off the Tk thread, one at a time
+        self._export_executor = ThreadPoolExecutor(max_workers=1)
+        
         # Configure main window
         self.root.title("MontanaSpecimensMapper")
         self.root.state('zoomed')  # Start maximized
@@ -516,7 +572,7 @@ class MainApplication:
             if self.left_canvas.winfo_exists():
                 self.left_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
         
-        self.left_canvas.bind_all("<MouseWheel>", on_left_mousewheel)
+        bind_mousewheel(self.left_canvas, on_left_mousewheel)
         
         # Right panel (map display) - 77% width
         self.right_panel = ttk.Frame(self.main_container, style='TFrame')
@@ -570,6 +626,8 @@ class MainApplication:
         
         # Color ranges (5 colors with grayscale scheme)
         self.color_ranges = []
+        self._color_ranges_cache = None  # Sorted (min, max, color) tuples, reset whenever an entry changes
+        self._color_lut = None  # Lookup table built from them for np.digitize
         default_ranges = [
             (0, 0, "white"),
             (1, 10, "#e7e8e9"),  # Light gray
@@ -596,6 +654,8 @@ class MainApplication:
             color_entry.pack(side='left', fill='x', expand=True)
             
             self.color_ranges.append((min_var, max_var, color_var))
+            for var in (min_var, max_var, color_var):
+                var.trace_add('write', self._invalidate_color_lut)
         
         # Export Format & Options Section
         export_frame = ttk.LabelFrame(self.left_panel, text="Export Format & Options", padding="10")
@@ -631,41 +691,108 @@ class MainApplication:
         self.canvas.get_tk_widget().pack(fill='both', expand=True)
 
     def load_excel(self):
+        if self._load_queue is not None:
+            return  # A file is already loading
+        
         file_path = filedialog.askopenfilename(
             filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
         )
         if not file_path:
             return
-            
+        
+        # Read and process the file off the Tk thread; progress comes back through the queue
+        loading = LoadingIndicator(self.root, "Loading Excel file...")
+        self._load_queue = queue.Queue()
+        threading.Thread(
+            target=self._load_excel_worker,
+            args=(file_path, self._load_queue, self.montana_counties is None),
+            daemon=True
+        ).start()
+        self.root.after(50, self._drain_load_queue, loading, file_path)
+
+    def _load_excel_worker(self, file_path, progress, load_counties):
+        """Read and process the Excel file in a worker thread. Never touches Tk."""
         try:
-            # Show loading indicator
-            loading = LoadingIndicator(self.root, "Loading Excel file...")
-            
-            self.excel_data = pd.read_excel(file_path)
             required_columns = ['lat', 'lat_dir', 'long', 'long_dir', 'family', 'genus', 'species', 'year']
-            if not all(col in self.excel_data.columns for col in required_columns):
-                loading.destroy()
+            data = self._read_excel(file_path, required_columns)
+            if not all(col in data.columns for col in required_columns):
                 raise ValueError("Excel file must contain 'lat', 'lat_dir', 'long', 'long_dir', 'family', 'genus', 'species', and 'year' columns")
-                
-            self.file_path_var.set(file_path)
             
             # Process the data
-            loading.update_message("Processing data...")
+            progress.put(('progress', "Processing data..."))
             for col in ["family", "genus", "species"]:
-                self.excel_data[col] = self.excel_data[col].astype(str).str.strip().str.lower()
+                data[col] = self._normalize_taxon(data[col])
             
             # Convert year to numeric, handling any non-numeric values
-            self.excel_data['year'] = pd.to_numeric(self.excel_data['year'], errors='coerce')
+            data['year'] = pd.to_numeric(data['year'], errors='coerce')
+            
+            # Build the family -> genus -> species lookup used by the dropdowns
+            progress.put(('progress', "Updating dropdowns..."))
+            taxonomy = self._build_taxonomy(data)
+            
+            # Capitalize family names once over the categories; the column itself stays lowercase
+            family_categories = data["family"].cat.categories
+            family_display = dict(zip(family_categories, np.char.title(family_categories.to_numpy().astype(str)).tolist()))
             
-            # Get valid families (non-empty/non-null values)
-            loading.update_message("Updating dropdowns...")
-            valid_families = sorted(self.excel_data["family"].dropna().unique())
-            valid_families = [f for f in valid_families if str(f).strip() and str(f).lower() != 'nan']  # Remove empty strings and 'nan'
+            # Rows with a non-empty value per taxonomy column, for the "All" selections
+            taxon_present = {col: (data[col].notna() & (data[col] != "")).to_numpy() for col in ["family", "genus", "species"]}
+            
+            result = {'data': data, 'taxonomy': taxonomy, 'family_display': family_display,
+                      'taxon_present': taxon_present}
+            
+            # Load Montana counties (once per session)
+            if load_counties:
+                progress.put(('progress', "Loading Montana counties..."))
+                counties = self._load_montana_counties()
+                result['counties'] = counties
+                # Exterior ring of each county as a view into one contiguous coordinate array
+                _, coords, (ring_offsets, geom_offsets) = shapely.to_ragged_array(counties.geometry.values, include_z=False)
+                exteriors = geom_offsets[:-1]
+                result['county_verts'] = [coords[start:end] for start, end in zip(ring_offsets[exteriors], ring_offsets[exteriors + 1])]
+                # Lon/lat envelope, padded because reprojected edges can bow past their vertices
+                minx, miny, maxx, maxy = counties.to_crs("EPSG:4326").total_bounds
+                result['montana_bounds'] = (minx - 0.05, miny - 0.05, maxx + 0.05, maxy + 0.05)
+            
+            progress.put(('done', result))
+        except Exception as e:
+            progress.put(('error', e))
+
+    def _drain_load_queue(self, loading, file_path):
+        """Apply progress messages and the final result posted by the load worker"""
+        try:
+            while True:
+                kind, payload = self._load_queue.get_nowait()
+                if kind == 'progress':
+                    loading.update_message(payload)
+                    continue
+                
+                self._load_queue = None
+                loading.destroy()
+                if kind == 'error':
+                    self.toast.show_toast(f"Error loading file: {str(payload)}", error=True)
+                else:
+                    self._apply_loaded_excel(file_path, payload)
+                return
+        except queue.Empty:
+            self.root.after(50, self._drain_load_queue, loading, file_path)
+
+    def _apply_loaded_excel(self, file_path, result):
+        """Install a loaded workbook and refresh the dropdowns (Tk thread)"""
+        try:
+            self.excel_data = result['data']
+            self._taxonomy = result['taxonomy']
+            self._family_display = result['family_display']
+            self._taxon_present = result['taxon_present']
+            if 'counties' in result and self.montana_counties is None:
+                self.montana_counties = result['counties']
+                self._county_verts = result['county_verts']
+                self._to_county_crs = Transformer.from_crs("EPSG:4326", self.montana_counties.crs, always_xy=True)
+                self._montana_bounds = result['montana_bounds']
             
-            # Capitalize family names
-            family_values = ["All"] + [f.title() for f in valid_families]
+            self.file_path_var.set(file_path)
             
             # Update Family dropdown
+            family_values = ["All"] + [self._family_display[f] for f in sorted(self._taxonomy)]
             self.family_dropdown["values"] = family_values
             self.family_dropdown.set("Select Family")
             
@@ -675,86 +802,138 @@ class MainApplication:
             self.species_dropdown.set("Select Species")
             self.species_dropdown["values"] = []
             
-            # Load Montana counties
-            loading.update_message("Loading Montana counties...")
-            all_counties = gpd.read_file(resource_path("shapefiles/cb_2021_us_county_5m.shp"))
-            self.montana_counties = all_counties[all_counties['STATEFP'] == '30']
-            self.montana_counties = self.montana_counties.to_crs("EPSG:32100")
-            
             # Bind dropdowns
             self.family_dropdown.bind("<<ComboboxSelected>>", self.update_genus_dropdown)
             self.genus_dropdown.bind("<<ComboboxSelected>>", self.update_species_dropdown)
             
-            # Destroy loading indicator
-            loading.destroy()
-            
             # Show summary dialog
             SummaryDialog(self.root, file_path, self.excel_data)
             
             self.toast.show_toast("Excel file loaded successfully")
             
         except Exception as e:
-            if 'loading' in locals():
-                loading.destroy()
             self.toast.show_toast(f"Error loading file: {str(e)}", error=True)
 
-    def dms_to_decimal(self, coord):
+    def _read_excel(self, file_path, columns):
+        """Read only the given columns, preferring the calamine engine over openpyxl"""
+        read_kwargs = {
+            'usecols': lambda col: col in columns,
+            # Text columns go straight into Arrow-backed strings; the rest are mixed and parsed later
+            'dtype': {col: 'string[pyarrow]' for col in ['family', 'genus', 'species', 'lat_dir', 'long_dir']},
+        }
+        try:
+            return pd.read_excel(file_path, engine='calamine', **read_kwargs)
+        except ImportError:
+            # python-calamine not installed (pandas opens openpyxl workbooks read-only)
+            print("Warning: python-calamine not available, falling back to openpyxl")
+            return pd.read_excel(file_path, engine='openpyxl', **read_kwargs)
+
+    def _normalize_taxon(self, values):
         """
-        Convert a coordinate in DMS format (e.g., '44°41.576'') to decimal degrees.
-        Handles both unicode and ascii degree/minute/second symbols.
+        Strip and lowercase a taxonomy column into a Categorical.
+        Only the distinct values are normalized; rows are remapped by code.
         """
-        if isinstance(coord, float) or isinstance(coord, int):
-            return float(coord)
-        if not isinstance(coord, str):
-            return float('nan')
-        # Remove unwanted characters and normalize
-        coord = coord.replace("'", "'").replace("″", '"').replace("""", '"').replace(""", '"')
-        dms_pattern = r"(\d+)[°\s]+(\d+(?:\.\d+)?)[\'′]?\s*(\d*(?:\.\d+)?)[\"″]?"
-        match = re.match(dms_pattern, coord.strip())
-        if match:
-            deg = float(match.group(1))
-            min_ = float(match.group(2))
-            sec = float(match.group(3)) if match.group(3) else 0.0
-            return deg + min_ / 60 + sec / 3600
-        try:
-            return float(coord)
-        except Exception:
-            return float('nan')
+        raw = values.astype('category')
+        normalized = raw.cat.categories.str.strip().str.lower()
+        categories = normalized.unique().sort_values()
+        
+        # Old code -> new code, with a trailing -1 so missing values (code -1) stay missing
+        remap = np.append(categories.get_indexer(normalized), -1)
+        codes = remap[raw.cat.codes.to_numpy()]
+        return pd.Series(pd.Categorical.from_codes(codes, categories=categories), index=values.index, name=values.name)
+
+    def _build_taxonomy(self, data):
+        """Build {family: {genus: [species, ...]}} from the non-empty taxonomy values"""
+        taxonomy = {}
+        has_family = data['family'].notna() & (data['family'] != '')
+        combos = data.loc[has_family, ['family', 'genus', 'species']].drop_duplicates()
+        
+        for family, genus, species in combos.itertuples(index=False):
+            genera = taxonomy.setdefault(family, {})
+            if pd.isna(genus) or not genus:
+                continue
+            species_set = genera.setdefault(genus, set())
+            if pd.notna(species) and species:
+                species_set.add(species)
+        
+        return {
+            family: {genus: sorted(species) for genus, species in genera.items()}
+            for family, genera in taxonomy.items()
+        }
 
-    def convert_coordinates(self, row):
-        """Convert coordinates taking into account direction (N/S, E/W) and DMS/decimal formats"""
+    def _load_montana_counties(self):
+        """Load Montana counties in EPSG:32100, using the GeoParquet cache when it is up to date"""
+        shapefile_path = resource_path(COUNTIES_SHAPEFILE)
+        if getattr(sys, 'frozen', False):
+            # The bundled files are extracted to a temporary directory on every launch, so
+            # keep the cache in the user's cache dir and invalidate it when the app is rebuilt
+            cache_path = user_cache_path(os.path.basename(COUNTIES_CACHE))
+            source_mtime = os.path.getmtime(sys.executable)
+        else:
+            cache_path = resource_path(COUNTIES_CACHE)
+            source_mtime = os.path.getmtime(shapefile_path)
+        
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= source_mtime:
+            try:
+                return gpd.read_parquet(cache_path)
+            except Exception as e:
+                print(f"Warning: Could not read county cache: {str(e)}")
+        
         try:
-            lat = self.dms_to_decimal(row['lat'])
-            long = self.dms_to_decimal(row['long'])
-            
-            # Convert direction values to string and handle potential NaN/float values
-            lat_dir = str(row['lat_dir']).strip().upper() if pd.notna(row['lat_dir']) else 'N'
-            long_dir = str(row['long_dir']).strip().upper() if pd.notna(row['long_dir']) else 'W'
-            
-            # Validate direction values
-            if lat_dir not in ['N', 'S']:
-                print(f"Invalid latitude direction: {lat_dir}, defaulting to 'N'")
-                lat_dir = 'N'
-            if long_dir not in ['E', 'W']:
-                print(f"Invalid longitude direction: {long_dir}, defaulting to 'W'")
-                long_dir = 'W'
-            
-            # Adjust for direction
-            if lat_dir == 'S':  # If Southern hemisphere
-                lat = -lat
-            if long_dir == 'W':  # If Western hemisphere
-                long = -long
-            
-            # Montana is roughly between 44°N to 49°N and 104°W to 116°W
-            # Validate the coordinates are somewhat reasonable
-            if not (44 <= abs(lat) <= 49 and 104 <= abs(long) <= 116):
-                print(f"Warning: Coordinates ({lat}, {long}) might be outside Montana's bounds")
-            
-            return Point(long, lat)
+            import pyogrio
+            # Let OGR filter to Montana so only its counties are ever materialized
+            montana_counties = pyogrio.read_dataframe(
+                shapefile_path, columns=['STATEFP', 'NAME'], where="STATEFP = '30'"
+            )
+        except ImportError:
+            print("Warning: pyogrio not installed, reading all US counties")
+            all_counties = gpd.read_file(shapefile_path)
+            montana_counties = all_counties[all_counties['STATEFP'] == '30']
+        montana_counties = montana_counties.to_crs("EPSG:32100")
+        
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            montana_counties.to_parquet(cache_path)
         except Exception as e:
-            print(f"Error converting coordinates: {str(e)}")
-            # Return a point outside Montana's bounds which will be filtered out
-            return Point(0, 0)
+            print(f"Warning: Could not write county cache: {str(e)}")
+        
+        return montana_counties
+
+    def dms_to_decimal_vec(self, values):
+        """
+        Convert a column of coordinates, decimal or DMS (e.g., '44°41.576''), to decimal degrees.
+        Handles both unicode and ascii degree/minute/second symbols; unparseable values become NaN.
+        """
+        # Numbers and decimal strings are handled in a single pass
+        decimal = pd.to_numeric(values, errors='coerce')
+
+        # Only the leftovers (DMS strings) need parsing
+        remaining = decimal.isna() & values.notna()
+        if remaining.any():
+            text = values[remaining].astype(str).str.translate(_DMS_TRANS).str.strip()
+            parts = text.str.extract(_DMS_RE)
+            deg = parts[0].astype(float)
+            min_ = parts[1].astype(float)
+            sec = pd.to_numeric(parts[2], errors='coerce').fillna(0.0)
+            decimal[remaining] = (deg + min_ / 60 + sec / 3600).fillna(pd.to_numeric(text, errors='coerce'))
+
+        return decimal
+
+    def decimal_coordinates_vec(self, df):
+        """
+        Signed decimal (long, lat) arrays for every row of df, taking direction (N/S, E/W) into account.
+        Unparseable coordinates are NaN.
+        """
+        lat = self.dms_to_decimal_vec(df['lat']).to_numpy(dtype=float)
+        long = self.dms_to_decimal_vec(df['long']).to_numpy(dtype=float)
+
+        # Missing or invalid directions default to 'N' and 'W'
+        lat_dir = df['lat_dir'].str.strip().str.upper()
+        long_dir = df['long_dir'].str.strip().str.upper()
+        lat = np.where(lat_dir.eq('S').to_numpy(dtype=bool, na_value=False), -lat, lat)
+        long = np.where(long_dir.eq('E').to_numpy(dtype=bool, na_value=False), long, -long)
+
+        return long, lat
 
     def generate_map(self):
         if self.excel_data is None:
@@ -797,23 +976,16 @@ class MainApplication:
             
             loading.update_message("Filtering data...")
             
-            # Filter data based on species selection
-            filtered = self.excel_data.copy()
-            
-            if fam == "All":
-                filtered = filtered[filtered["family"].notna() & (filtered["family"].str.strip() != "")]
-            else:
-                filtered = filtered[filtered["family"].str.lower() == fam.lower()]
-                
-            if gen == "All":
-                filtered = filtered[filtered["genus"].notna() & (filtered["genus"].str.strip() != "")]
-            else:
-                filtered = filtered[filtered["genus"].str.lower() == gen.lower()]
-                
-            if spec == "all":
-                filtered = filtered[filtered["species"].notna() & (filtered["species"].str.strip() != "")]
-            else:
-                filtered = filtered[filtered["species"].str.lower() == spec.lower()]
+            # Filter data based on species selection with one combined mask; the taxonomy
+            # columns are already stripped/lowercased Categoricals, so these compare category codes
+            data = self.excel_data
+            mask = np.ones(len(data.index), dtype=bool)
+            for column, value, all_value in [("family", fam, "All"), ("genus", gen, "All"), ("species", spec, "all")]:
+                if value == all_value:
+                    mask &= self._taxon_present[column]  # precomputed at load
+                else:
+                    mask &= (data[column] == value.lower()).to_numpy()
+            filtered = data.loc[mask]
             
             if len(filtered) == 0:
                 loading.destroy()
@@ -822,34 +994,38 @@ class MainApplication:
             
             loading.update_message("Converting coordinates...")
             
-            # Convert coordinates to points
-            geometries = filtered.apply(self.convert_coordinates, axis=1)
+            # Convert coordinates, dropping rows that could not be parsed or are out of range
+            long, lat = self.decimal_coordinates_vec(filtered)
+            valid = (np.abs(lat) <= 90) & (np.abs(long) <= 180)  # NaN compares False
+            skipped = int(np.count_nonzero(~valid))
+            
+            # Cull points outside Montana's envelope before building geometry; the join does the exact test
+            minx, miny, maxx, maxy = self._montana_bounds
+            keep = valid & (long >= minx) & (long <= maxx) & (lat >= miny) & (lat <= maxy)
+            
+            # Project the raw coordinates to the county CRS and build the points there
+            x, y = self._to_county_crs.transform(long[keep], lat[keep])
             points = gpd.GeoDataFrame(
-                filtered,
-                geometry=geometries,
-                crs="EPSG:4326"
+                filtered.loc[keep],
+                geometry=gpd.points_from_xy(x, y, crs=self.montana_counties.crs)
             )
             
-            # Filter points within Montana
-            montana_boundary = self.montana_counties.dissolve().to_crs("EPSG:4326").geometry.iloc[0]
-            points = points[points.geometry.within(montana_boundary)]
+            # Assign each point to its county in one spatial join; points in no county are outside Montana
+            points = points.sjoin(self.montana_counties[['geometry']], how='inner', predicate='within')
             
             if len(points) == 0:
                 loading.destroy()
                 self.toast.show_toast("No points found within Montana's boundaries", error=True)
                 return
             
-            # Convert to county CRS
-            points = points.to_crs(self.montana_counties.crs)
-            
             # Create two datasets based on year
             loading.update_message("Creating year-based datasets...")
             
-            # Map A: Data before or equal to selected year
-            map_a_data = points[points['year'] <= selected_year].copy()
+            # Map A: Data before or equal to selected year (process_county_data only reads, so no copies)
+            map_a_data = points[points['year'] <= selected_year]
             
             # Map B: All data
-            map_b_data = points.copy()
+            map_b_data = points
             
             # Process both maps
             loading.update_message("Processing Map A (≤ selected year)...")
@@ -871,7 +1047,10 @@ class MainApplication:
             self.display_maps()
             
             loading.destroy()
-            self.toast.show_toast("County maps generated successfully")
+            message = "County maps generated successfully"
+            if skipped:
+                message += f" ({skipped:,} records skipped: invalid coordinates)"
+            self.toast.show_toast(message)
             
         except Exception as e:
             if 'loading' in locals():
@@ -882,111 +1061,169 @@ class MainApplication:
         """Process point data and assign colors to counties based on point density"""
         # Create a copy of counties for processing
         counties_with_data = self.montana_counties.copy()
-        counties_with_data['point_count'] = 0
         counties_with_data['color'] = 'white'  # Default color for counties with no data
         
-        # Count points in each county
-        for idx, county in counties_with_data.iterrows():
-            points_in_county = points_data[points_data.geometry.within(county.geometry)]
-            counties_with_data.at[idx, 'point_count'] = len(points_in_county)
-        
-        # Assign colors based on ranges
-        ranges = []
-        for min_var, max_var, color_var in self.color_ranges:
-            min_val = float(min_var.get())
-            max_val = float('inf') if max_var.get() == "∞" else float(max_var.get())
-            ranges.append((min_val, max_val, color_var.get()))
+        # Count points per county from the county assignment made by the spatial join
+        county_idx = self.montana_counties.index.get_indexer(points_data['index_right'])
+        counties_with_data['point_count'] = np.bincount(county_idx, minlength=len(counties_with_data))
         
-        ranges.sort(key=lambda x: x[0])
-        
-        for min_val, max_val, color in ranges:
-            mask = (counties_with_data['point_count'] >= min_val) & (counties_with_data['point_count'] <= max_val)
-            counties_with_data.loc[mask, 'color'] = color
+        # Assign colors based on ranges through the lookup table
+        edges, at_edge, above_edge, colors = self._parse_color_ranges()
+        counts = counties_with_data['point_count'].to_numpy()
+        j = np.digitize(counts, edges) - 1
+        k = np.where(counts == edges[j], at_edge[j], above_edge[j])
+        counties_with_data['color'] = colors[np.where(j >= 0, k, -1)]
         
         return counties_with_data
     
+    def _parse_color_ranges(self):
+        """
+        Parse the color range inputs into a lookup table for np.digitize, cached until
+        one of the inputs changes. Returns (edges, at_edge, above_edge, colors):
+        edges are the sorted range bounds, at_edge[j] / above_edge[j] index into colors
+        for a count equal to edges[j] / between edges[j] and edges[j + 1].
+        Index -1 is 'white' (no range matches).
+        """
+        if self._color_lut is None:
+            ranges = self._parsed_color_ranges()
+            
+            # Representative counts for each edge and each gap above it
+            edges = np.unique([bound for r in ranges for bound in r[:2]])
+            upper = np.append(edges[1:], np.inf)
+            inside = np.where(np.isinf(upper), edges + 1, (edges + upper) / 2)
+            
+            # Later ranges take precedence, as they did when colors were assigned in order
+            def lookup(values):
+                result = np.full(len(values), -1)
+                for k, (min_val, max_val, _) in enumerate(ranges):
+                    result[(values >= min_val) & (values <= max_val)] = k
+                return result
+            
+            colors = np.array([r[2] for r in ranges] + ['white'], dtype=object)
+            self._color_lut = (edges, lookup(edges), lookup(inside), colors)
+        return self._color_lut
+    
+    def _parsed_color_ranges(self):
+        """(min, max, color) tuples from the range inputs sorted by minimum, cached until an input changes"""
+        if self._color_ranges_cache is None:
+            ranges = []
+            for min_var, max_var, color_var in self.color_ranges:
+                min_val = float(min_var.get())
+                max_val = float('inf') if max_var.get() == "∞" else float(max_var.get())
+                ranges.append((min_val, max_val, color_var.get()))
+            
+            ranges.sort(key=lambda x: x[0])
+            self._color_ranges_cache = ranges
+        return self._color_ranges_cache
+    
+    def _invalidate_color_lut(self, *args):
+        self._color_ranges_cache = None
+        self._color_lut = None
+    
     def display_maps(self):
         """Display both Map A and Map B vertically with legend at bottom right"""
         if self.current_maps is None:
             return
         
+        # Build the artists on first display; afterwards only their colors and text change
+        if self._map_artists is None:
+            self._map_artists = self._draw_maps(self.figure)
+        else:
+            self._update_maps(self._map_artists)
+        self.ax1, self.ax2 = self._map_artists['axes']
+        
+        # Schedule a redraw; Tk coalesces pending draws into one
+        self.canvas.draw_idle()
+
+    def _update_maps(self, artists):
+        """Refresh the artists returned by _draw_maps for the current maps"""
+        self._set_map_title(artists['figure'])
+        artists['polys'][0].set_facecolor(self.current_maps['map_a']['color'].tolist())
+        artists['polys'][1].set_facecolor(self.current_maps['map_b']['color'].tolist())
+        artists['year_label'].set_text(f"Map A <= {self.current_maps['selected_year']}")
+        
+        # The legend mirrors the range inputs, which may have changed
+        artists['legend'].remove()
+        artists['legend'] = self._add_legend(artists['axes'][1])
+
+    def _draw_maps(self, figure, fontfamily=None):
+        """
+        Draw Map A and Map B with title and legend onto figure; returns the artists for _update_maps.
+        fontfamily, when given, is applied to every text artist (title, map labels and legend).
+        """
         # Clear the figure
-        self.figure.clf()
+        figure.clf()
         
         # Create gridspec for layout control - single column, two rows
-        gs = self.figure.add_gridspec(2, 1, height_ratios=[1, 1])
+        gs = figure.add_gridspec(2, 1, height_ratios=[1, 1])
         
         # Add taxonomic hierarchy title at the top center
-        species_info = self.current_maps['species_info']
-        if species_info:
-            family, genus, species = species_info.split(' > ')
-            title = f"{family} > {genus} > {species}"
-            self.figure.suptitle(title, x=0.5, y=0.99, 
-                               ha='center', va='top',
-                               fontsize=14, fontweight='bold')
+        self._set_map_title(figure, fontfamily)
         
         # Create subplots for both maps
-        self.ax1 = self.figure.add_subplot(gs[0])  # Map A (top)
-        self.ax2 = self.figure.add_subplot(gs[1])  # Map B (bottom)
+        ax1 = figure.add_subplot(gs[0])  # Map A (top)
+        ax2 = figure.add_subplot(gs[1])  # Map B (bottom)
         
         # Configure both axes
-        for ax in [self.ax1, self.ax2]:
+        for ax in [ax1, ax2]:
             ax.set_frame_on(False)  # Remove frame
             ax.set_xticks([])
             ax.set_yticks([])
             ax.set_aspect('equal')
         
-        # Plot Map A (≤ selected year)
-        map_a_counties = self.current_maps['map_a']
-        for idx, county in map_a_counties.iterrows():
-            self.ax1.fill(county.geometry.exterior.xy[0], 
-                         county.geometry.exterior.xy[1],
-                         facecolor=county['color'],
-                         edgecolor='black',
-                         linewidth=0.5)
-        
-        # Plot Map B (all data)
-        map_b_counties = self.current_maps['map_b']
-        for idx, county in map_b_counties.iterrows():
-            self.ax2.fill(county.geometry.exterior.xy[0], 
-                         county.geometry.exterior.xy[1],
-                         facecolor=county['color'],
-                         edgecolor='black',
-                         linewidth=0.5)
+        # Plot Map A (≤ selected year) and Map B (all data) from the cached county outlines
+        polys = []
+        for ax, counties in [(ax1, self.current_maps['map_a']), (ax2, self.current_maps['map_b'])]:
+            polys.append(ax.add_collection(PolyCollection(self._county_verts,
+                                                          facecolors=counties['color'].tolist(),
+                                                          edgecolors='black',
+                                                          linewidths=0.5)))
         
         # Set bounds for both maps
         bounds = self.montana_counties.total_bounds
         padding = (bounds[2] - bounds[0]) * 0.05  # Small padding
         
-        for ax in [self.ax1, self.ax2]:
+        for ax in [ax1, ax2]:
             ax.set_xlim([bounds[0] - padding, bounds[2] + padding])
             ax.set_ylim([bounds[1] - padding, bounds[3] + padding])
         
         # Add A and B labels centered at the top of each map
         selected_year = self.current_maps['selected_year']
-        self.ax1.text(0.5, 0.98, f'Map A <= {selected_year}', transform=self.ax1.transAxes,
-                     fontsize=12, fontweight='bold', va='top', ha='center')
-        self.ax2.text(0.5, 0.98, 'Map B: All data', transform=self.ax2.transAxes,
-                     fontsize=12, fontweight='bold', va='top', ha='center')
+        year_label = ax1.text(0.5, 0.98, f'Map A <= {selected_year}', transform=ax1.transAxes,
+                              fontsize=12, fontweight='bold', va='top', ha='center',
+                              fontfamily=fontfamily)
+        ax2.text(0.5, 0.98, 'Map B: All data', transform=ax2.transAxes,
+                 fontsize=12, fontweight='bold', va='top', ha='center', fontfamily=fontfamily)
+        
+        legend = self._add_legend(ax2, fontfamily)
+        
+        # Adjust layout - reduce vertical space between maps
+        figure.subplots_adjust(left=0.05, right=0.95, 
+                             bottom=0.05, top=0.95,
+                             hspace=0.02)  # Reduced vertical spacing
         
+        return {'figure': figure, 'axes': (ax1, ax2), 'polys': polys,
+                'year_label': year_label, 'legend': legend}
+
+    def _set_map_title(self, figure, fontfamily=None):
+        """Set the taxonomic hierarchy title; suptitle reuses the existing text artist"""
+        species_info = self.current_maps['species_info']
+        if species_info:
+            family, genus, species = species_info.split(' > ')
+            title = f"{family} > {genus} > {species}"
+            figure.suptitle(title, x=0.5, y=0.99, 
+                          ha='center', va='top',
+                          fontsize=14, fontweight='bold', fontfamily=fontfamily)
+
+    def _add_legend(self, ax, fontfamily=None):
+        """Add the color range legend to the bottom right of ax"""
         # Create legend elements using current color ranges from input fields
         import matplotlib.patches as mpatches
         legend_elements = []
         legend_labels = []
         
-        # Get current color ranges from input fields
-        ranges = []
-        for min_var, max_var, color_var in self.color_ranges:
-            min_val = float(min_var.get())
-            max_val = float('inf') if max_var.get() == "∞" else float(max_var.get())
-            color = color_var.get()
-            ranges.append((min_val, max_val, color))
-        
-        # Sort ranges by minimum value
-        ranges.sort(key=lambda x: x[0])
-        
-        # Create legend labels and elements
-        for i, (min_val, max_val, color) in enumerate(ranges):
+        # Create legend labels and elements from the same parsed ranges used to color the counties
+        for i, (min_val, max_val, color) in enumerate(self._parsed_color_ranges()):
             if max_val == float('inf'):
                 label = f"{int(min_val)}+"
             else:
@@ -998,19 +1235,12 @@ class MainApplication:
                                                 label=label))
         
         # Add legend to bottom right of Map B
-        legend = self.ax2.legend(handles=legend_elements,
-                               loc='lower right',
-                               frameon=False,
-                               bbox_to_anchor=(1.2, 0.165),
-                               ncol=1)
-        
-        # Adjust layout - reduce vertical space between maps
-        self.figure.subplots_adjust(left=0.05, right=0.95, 
-                                  bottom=0.05, top=0.95,
-                                  hspace=0.02)  # Reduced vertical spacing
-        
-        # Draw the canvas
-        self.canvas.draw()
+        return ax.legend(handles=legend_elements,
+                         loc='lower right',
+                         frameon=False,
+                         bbox_to_anchor=(1.2, 0.165),
+                         ncol=1,
+                         prop={'family': fontfamily})
 
     def download_map(self):
         if self.current_maps is None:
@@ -1021,7 +1251,7 @@ class MainApplication:
             import datetime
             from pathlib import Path
             import os
-            import matplotlib as mpl
+            from matplotlib import font_manager
             
             # Get Downloads folder path
             downloads_path = str(Path.home() / "Downloads")
@@ -1037,30 +1267,39 @@ class MainApplication:
             filename = f"MontanaSpecimensMaps_{timestamp}.{export_format}"
             file_path = os.path.join(downloads_path, filename)
             
-            # Configure matplotlib settings based on export format
+            # Configure font settings based on export format; passed to the artists directly
+            # because rcParams are global and a previous export may still be saving
+            fontfamily = None
             if export_format == 'svg':
                 # Check if SVG backend is available
                 try:
                     import matplotlib.backends.backend_svg
-                    # Preserve text as editable elements in SVG
-                    mpl.rcParams['svg.fonttype'] = 'none'
                 except ImportError:
                     messagebox.showerror("Error", 
                         "SVG export is not available in this build.\n"
                         "Please select TIFF or JPG format instead.")
                     return
             elif export_format in ['tiff', 'jpg']:
-                # High quality settings for TIFF and JPG
-                mpl.rcParams['font.family'] = 'serif'
-                mpl.rcParams['font.serif'] = ['Times New Roman', 'Times', 'DejaVu Serif', 'serif']
+                # High quality settings for TIFF and JPG: the first installed serif face
+                for family in ['Times New Roman', 'Times', 'DejaVu Serif', 'serif']:
+                    try:
+                        serif_path = font_manager.findfont(font_manager.FontProperties(family=family),
+                                                           fallback_to_default=False)
+                    except ValueError:
+                        continue
+                    fontfamily = font_manager.get_font(serif_path).family_name
+                    break
             
-            # Save the figure with dynamic format
-            self.figure.savefig(file_path, format=export_format, dpi=300, bbox_inches='tight')
+            # Draw the maps onto an off-screen figure (artist setup stays on the Tk thread)
+            export_figure = Figure(figsize=self.figure.get_size_inches())
+            FigureCanvasAgg(export_figure)
+            self._draw_maps(export_figure, fontfamily)
             
-            # Show toast notification
-            self.toast.show_toast(f"Maps saved as {filename}")
-            
-            print(f"✅ {export_format.upper()} maps saved as '{file_path}'")
+            # Render and write the file in the background so the UI stays responsive
+            exporters = {'svg': self._export_svg, 'tiff': self._export_tiff, 'jpg': self._export_jpg}
+            future = self._export_executor.submit(exporters[export_format], export_figure, file_path)
+            # Poll from the Tk thread; the executor thread must never call into Tk
+            self.root.after(50, self._poll_export, future, export_format, filename, file_path)
             
         except Exception as e:
             messagebox.showerror("Error", 
@@ -1068,7 +1307,51 @@ class MainApplication:
                 "Please try again."
             )
 
+    def _export_svg(self, figure, file_path):
+        """Vector export; no raster is rendered so DPI does not apply"""
+        figure.savefig(file_path, format='svg', bbox_inches='tight')
+
+    def _export_tiff(self, figure, file_path, dpi=300):
+        """High-resolution raster export, LZW compressed (lossless)"""
+        figure.savefig(file_path, format='tiff', dpi=dpi, bbox_inches='tight',
+                       pil_kwargs={'compression': 'tiff_lzw'})
+
+    def _export_jpg(self, figure, file_path, dpi=300):
+        """Raster export as an optimized progressive JPEG (quality 92)"""
+        figure.savefig(file_path, format='jpg', dpi=dpi, bbox_inches='tight',
+                       pil_kwargs={'quality': 92, 'optimize': True, 'progressive': True})
+
+    def _poll_export(self, future, export_format, filename, file_path):
+        """Wait for a background export without blocking the UI"""
+        if not future.done():
+            self.root.after(50, self._poll_export, future, export_format, filename, file_path)
+            return
+        self._on_export_done(future, export_format, filename, file_path)
+
+    def _on_export_done(self, future, export_format, filename, file_path):
+        """Report the result of a background export (runs on the Tk thread)"""
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror("Error", 
+                f"Error saving file:\n{str(error)}\n\n"
+                "Please try again."
+            )
+            return
+        
+        # Show toast notification
+        self.toast.show_toast(f"Maps saved as {filename}")
+        
+        print(f"✅ {export_format.upper()} maps saved as '{file_path}'")
+
     def on_window_resize(self, event=None):
+        # <Configure> fires many times per drag; only re-layout once resizing pauses
+        if self._resize_after is not None:
+            self.root.after_cancel(self._resize_after)
+        self._resize_after = self.root.after(150, self._apply_resize)
+
+    def _apply_resize(self):
+        self._resize_after = None
+        
         # Maintain 23%/77% ratio when window is resized
         self.set_panel_widths()
         
@@ -1081,7 +1364,7 @@ class MainApplication:
         if self.current_maps is not None:
             self.display_maps()
         else:
-            self.canvas.draw()
+            self.canvas.draw_idle()
 
     def set_panel_widths(self):
         """Set the left panel to 23% width and right panel to 77% width"""
@@ -1104,17 +1387,11 @@ class MainApplication:
             self.genus_dropdown.set("Select Genus")
             return
         
-        # Filter based on family selection
+        # Look up genera for the family selection
         if family == "All":
-            # Get all non-empty genus values
-            filtered = self.excel_data[self.excel_data["genus"].notna() & (self.excel_data["genus"].str.strip() != "")]
+            valid_genera = sorted({genus for genera in self._taxonomy.values() for genus in genera})
         else:
-            # Get genus for specific family (case-insensitive)
-            filtered = self.excel_data[self.excel_data["family"].str.lower() == family.lower()]
-        
-        # Get valid genera (non-empty/non-null values)
-        valid_genera = sorted(filtered["genus"].dropna().unique())
-        valid_genera = [g for g in valid_genera if str(g).strip() and str(g).lower() != 'nan']  # Remove empty strings and 'nan'
+            valid_genera = sorted(self._taxonomy.get(family.lower(), {}))
         
         # Create genus list with special options
         genus_values = ["All"] + [g.title() for g in valid_genera]
@@ -1136,24 +1413,20 @@ class MainApplication:
             self.species_dropdown.set("Select Species")
             return
         
-        # Start with base DataFrame
-        filtered = self.excel_data
-        
-        # Apply family filter
+        # Look up species for the family and genus selections
         if family == "All":
-            filtered = filtered[filtered["family"].notna() & (filtered["family"].str.strip() != "")]
-        else:
-            filtered = filtered[filtered["family"].str.lower() == family.lower()]
-        
-        # Apply genus filter
-        if genus == "All":
-            filtered = filtered[filtered["genus"].notna() & (filtered["genus"].str.strip() != "")]
+            families = self._taxonomy.values()
         else:
-            filtered = filtered[filtered["genus"].str.lower() == genus.lower()]
+            families = [self._taxonomy.get(family.lower(), {})]
         
-        # Get valid species (non-empty/non-null values)
-        valid_species = sorted(filtered["species"].dropna().unique())
-        valid_species = [s for s in valid_species if str(s).strip() and str(s).lower() != 'nan']  # Remove empty strings and 'nan'
+        valid_species = set()
+        for genera in families:
+            if genus == "All":
+                for species in genera.values():
+                    valid_species.update(species)
+            else:
+                valid_species.update(genera.get(genus.lower(), []))
+        valid_species = sorted(valid_species)
         
         # Create species list with special options - note lowercase for species
         species_values = ["all"] + valid_species
@@ -1,8 +1,13 @@
 from PIL import Image, ImageDraw, ImageFont
 import os
 
-def create_icon():
+def create_icon(force=False):
     """Create icon for MontanaSpecimensMapper application"""
+    # The icons are static assets; only redraw them when missing (or forced)
+    if not force and os.path.exists('app_icon.png') and os.path.exists('app_icon.ico'):
+        print("✓ Icon files already exist, skipping")
+        return
+    
     # Create a new image with a white background
     size = (256, 256)
     icon = Image.new('RGBA', size, (255, 255, 255, 0))
@@ -78,13 +83,10 @@ def create_icon():
     # Save as PNG
     icon.save('app_icon.png', 'PNG')
     
-    # Save as ICO (Windows icon) with multiple sizes
-    icon_sizes = []
-    for size in sizes:
-        resized = icon.resize(size, Image.Resampling.LANCZOS)
-        icon_sizes.append(resized)
-    
-    icon_sizes[0].save('app_icon.ico', format='ICO', sizes=[(s[0], s[1]) for s in sizes])
+    # Save as ICO (Windows icon) with multiple sizes. Pillow downsamples each size from
+    # the full icon and drops any size larger than the image it is given, so save from
+    # the 256x256 original rather than a pre-shrunk copy
+    icon.save('app_icon.ico', format='ICO', sizes=sizes)
     
     print("✓ Icon files created successfully:")
     print("  - app_icon.png")